@@ -7,7 +7,7 @@ from .action import Action, ActionExecutionError, ActionValidationError
 from .logger import LogLevel, WorkflowLogger  # noqa: F401
 from .registry import ActionRegistry, ActionRegistryError, WorkflowContext
 from .status import TaskStatus  # noqa: F401
-from .workflow import WorkflowExecutionError, WorkflowExecutor
+from .workflow import MatrixJobs, WorkflowExecutionError, WorkflowExecutor
 
 __version__ = "0.1.0"
 __author__ = "CausalIQ"
@@ -36,4 +36,5 @@ __all__ = [
     "WorkflowContext",
     "WorkflowExecutor",
     "WorkflowExecutionError",
+    "MatrixJobs",
 ]
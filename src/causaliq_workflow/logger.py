@@ -7,7 +7,10 @@ multiple output destinations (terminal, file, test capture).
 import sys
 from enum import Enum
 from pathlib import Path
-from typing import Any, Optional, TextIO
+from typing import Any, Optional, TextIO, Union
+
+# Log file write buffer size, batching many log lines per write() syscall
+_FILE_BUFFER_SIZE = 64 * 1024
 
 
 class LogLevel(Enum):
@@ -43,12 +46,12 @@ class WorkflowLogger:
     def __init__(
         self,
         terminal: bool = True,
-        log_file: Optional[Path] = None,
+        log_file: Optional[Union[str, Path]] = None,
         log_level: LogLevel = LogLevel.SUMMARY,
     ) -> None:
         """Initialize logger with output destinations and verbosity level."""
         self.terminal = terminal
-        self.log_file = log_file
+        self.log_file = Path(log_file) if log_file is not None else None
         self.log_level = log_level
 
         # Initialize output streams
@@ -64,7 +67,12 @@ class WorkflowLogger:
             self.log_file.parent.mkdir(parents=True, exist_ok=True)
 
             # Open file in append mode to support multiple workflow runs
-            self._file_stream = open(self.log_file, "a", encoding="utf-8")
+            self._file_stream = open(
+                self.log_file,
+                "a",
+                buffering=_FILE_BUFFER_SIZE,
+                encoding="utf-8",
+            )
 
     def close(self) -> None:
         """Close file streams and cleanup resources."""
@@ -5,16 +5,68 @@ Provides centralized management of actions from external packages using
 setuptools entry points for clean plugin architecture.
 """
 
-import inspect
 import logging
 import sys
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Dict, FrozenSet, List, Optional, Type
 
 from causaliq_workflow.action import Action, ActionExecutionError
 
 logger = logging.getLogger(__name__)
 
+# Names of modules compiled into the interpreter, as a set for O(1) lookup
+_BUILTIN_MODULE_NAMES = frozenset(sys.builtin_module_names)
+
+
+class _ActionDict(dict[str, Type[Action]]):
+    """Action name to class mapping that counts its mutations.
+
+    The version lets the registry cache values derived from its actions
+    and detect when they are stale, however the mapping was changed.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.version = 0
+
+    def __setitem__(self, key: str, value: Type[Action]) -> None:
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self.version += 1
+
+    def clear(self) -> None:
+        super().clear()
+        self.version += 1
+
+    def pop(self, *args: Any) -> Any:
+        value = super().pop(*args)
+        self.version += 1
+        return value
+
+    def popitem(self) -> Any:
+        item = super().popitem()
+        self.version += 1
+        return item
+
+    def setdefault(self, *args: Any) -> Any:
+        value = super().setdefault(*args)
+        self.version += 1
+        return value
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self.version += 1
+
+    def __ior__(  # type: ignore[override,misc]
+        self, other: Any
+    ) -> "_ActionDict":
+        super().update(other)
+        self.version += 1
+        return self
+
 
 @dataclass
 class WorkflowContext:
@@ -71,8 +123,18 @@ class ActionRegistry:
             _actions: Dictionary mapping action names to Action classes
             _discovery_errors: List to collect any discovery errors
         """
-        self._actions: Dict[str, Type[Action]] = {}
+        self._actions = _ActionDict()
         self._discovery_errors: List[str] = []
+
+        # Package grouping derived from _actions, rebuilt when it changes
+        self._package_index: Dict[str, List[str]] = {}
+        self._action_to_package: Dict[str, str] = {}
+        self._package_index_version = -1
+
+        # Frozen action names, rebuilt when _actions changes
+        self._action_names: FrozenSet[str] = frozenset()
+        self._action_names_version = -1
+
         self._discover_actions()
 
     def _discover_actions(self) -> None:
@@ -84,57 +146,57 @@ class ActionRegistry:
             if module is None:
                 continue  # type: ignore[unreachable]
 
-            # Skip built-ins and standard library
-            if not hasattr(module, "__file__") or module.__file__ is None:
+            # Cheap name checks first: private modules and built-ins
+            if module_name.startswith("_"):
                 continue
 
-            if module_name.startswith("_"):
+            if module_name.partition(".")[0] in _BUILTIN_MODULE_NAMES:
                 continue
 
-            if "." in module_name:
-                root_module = module_name.split(".")[0]
-                if root_module in sys.builtin_module_names:
-                    continue
+            # Skip modules without a source file, e.g. frozen modules
+            if getattr(module, "__file__", None) is None:
+                continue
 
             self._scan_module_for_actions(module_name, module)
 
     def _scan_module_for_actions(self, module_name: str, module: Any) -> None:
         """Scan a specific module for Action classes."""
         try:
-            # Look for a CausalIQAction class exported at module level
-            if hasattr(module, "CausalIQAction"):
-                action_class = getattr(module, "CausalIQAction")
-
-                # Verify it's actually an Action subclass
+            # Look for a CausalIQAction class exported at module level, using
+            # a single attribute lookup rather than hasattr then getattr
+            action_class = getattr(module, "CausalIQAction", None)
+
+            # Verify it's actually an Action subclass
+            if not (
+                isinstance(action_class, type)
+                and issubclass(action_class, Action)
+                and action_class is not Action
+            ):
+                return
+
+            # Use the root package name as action name
+            action_name = module_name.split(".")[0]
+
+            if action_name not in self._actions:
+                self._actions[action_name] = action_class
+                logger.info(
+                    f"Registered action: {action_name} -> "
+                    f"{action_class.__name__}"
+                )
+
+                # Also register by action hyphenated name if different
                 if (
-                    inspect.isclass(action_class)
-                    and issubclass(action_class, Action)
-                    and action_class != Action
+                    hasattr(action_class, "name")
+                    and action_class.name != action_name
                 ):
-
-                    # Use the root package name as action name
-                    action_name = module_name.split(".")[0]
-
-                    if action_name not in self._actions:
-                        self._actions[action_name] = action_class
+                    hyphenated_name = action_class.name
+                    if hyphenated_name not in self._actions:
+                        self._actions[hyphenated_name] = action_class
                         logger.info(
-                            f"Registered action: {action_name} -> "
-                            f"{action_class.__name__}"
+                            f"Registered action: {hyphenated_name} -> "
+                            f"{action_class.__name__} (alias)"
                         )
 
-                        # Also register by action hyphenated name if different
-                        if (
-                            hasattr(action_class, "name")
-                            and action_class.name != action_name
-                        ):
-                            hyphenated_name = action_class.name
-                            if hyphenated_name not in self._actions:
-                                self._actions[hyphenated_name] = action_class
-                                logger.info(
-                                    f"Registered action: {hyphenated_name} -> "
-                                    f"{action_class.__name__} (alias)"
-                                )
-
         except Exception as e:
             error_msg = f"Error scanning module {module_name}: {e}"
             self._discovery_errors.append(error_msg)
@@ -188,6 +250,19 @@ class ActionRegistry:
         """
         return name in self._actions
 
+    @property
+    def action_names(self) -> FrozenSet[str]:
+        """Names of all available actions, including aliases.
+
+        Returns:
+            Frozen set of action names, rebuilt only when actions change
+
+        """
+        if self._action_names_version != self._actions.version:
+            self._action_names = frozenset(self._actions)
+            self._action_names_version = self._actions.version
+        return self._action_names
+
     def get_action_class(self, name: str) -> Type[Action]:
         """Get action class by name.
 
@@ -254,16 +329,19 @@ class ActionRegistry:
 
         """
         errors = []
+        steps = workflow.get("steps", [])
+        action_names = self.action_names
 
-        # Extract all action names from workflow steps
-        for step in workflow.get("steps", []):
-            if "uses" in step:
-                action_name = step["uses"]
-                if not self.has_action(action_name):
-                    available = list(self._actions.keys())
+        # Check all actions used by steps at once, only revisiting steps to
+        # report errors when some action is unknown
+        used = {step["uses"] for step in steps if "uses" in step}
+        if not used.issubset(action_names):
+            available = list(self._actions.keys())
+            for step in steps:
+                if "uses" in step and step["uses"] not in action_names:
                     errors.append(
                         f"Step '{step.get('name', 'unnamed')}' uses "
-                        f"unknown action '{action_name}'. Available: "
+                        f"unknown action '{step['uses']}'. Available: "
                         f"{available}"
                     )
 
@@ -279,7 +357,41 @@ class ActionRegistry:
             Dictionary mapping package names to action lists
 
         """
+        self._update_package_index()
+        return {
+            package_name: action_names.copy()
+            for package_name, action_names in self._package_index.items()
+        }
+
+    def get_action_package(self, name: str) -> str:
+        """Get name of the package providing an action.
+
+        Args:
+            name: Action name
+
+        Returns:
+            Root package name of the action's module
+
+        Raises:
+            ActionRegistryError: If action not found
+
+        """
+        self._update_package_index()
+        if name not in self._action_to_package:
+            available = list(self._actions.keys())
+            raise ActionRegistryError(
+                f"Action '{name}' not found. Available actions: {available}"
+            )
+
+        return self._action_to_package[name]
+
+    def _update_package_index(self) -> None:
+        """Rebuild package grouping of actions if actions have changed."""
+        if self._package_index_version == self._actions.version:
+            return
+
         packages: Dict[str, List[str]] = {}
+        action_to_package: Dict[str, str] = {}
 
         for action_name, action_class in self._actions.items():
             # Extract package name from module
@@ -293,5 +405,8 @@ class ActionRegistry:
                 packages[package_name] = []
 
             packages[package_name].append(action_name)
+            action_to_package[action_name] = package_name
 
-        return packages
+        self._package_index = packages
+        self._action_to_package = action_to_package
+        self._package_index_version = self._actions.version
@@ -4,12 +4,89 @@ JSON Schema-based workflow validation for CausalIQ.
 Uses standard JSON Schema validation with the jsonschema library.
 """
 
+import functools
 import json
+import re
+import sys
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, FrozenSet, Optional, Set, Tuple, Union
 
 import yaml
 
+# Prefer the libyaml-backed C loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Number of compiled schema validators kept, keyed by schema file identity
+_VALIDATOR_CACHE_SIZE = 8
+
+# Number of distinct template strings whose variable names are remembered
+_TEMPLATE_CACHE_SIZE = 2048
+
+# Matches {{variable_name}} with alphanumeric, _, - in the variable name
+_TEMPLATE_RE = re.compile(r"\{\{([a-zA-Z_][a-zA-Z0-9_-]*)\}\}")
+
+# Result for the common case of a string without any templates
+_NO_TEMPLATE_VARIABLES: FrozenSet[str] = frozenset()
+
+
+def extract_template_variables(text: str) -> FrozenSet[str]:
+    """Extract variable names used in {{variable}} patterns of a string.
+
+    Args:
+        text: String that may contain {{variable}} patterns
+
+    Returns:
+        Frozen set of variable names found in templates
+    """
+    # Substring check is far cheaper than a regex scan or cache lookup
+    if "{{" not in text:
+        return _NO_TEMPLATE_VARIABLES
+    return _scan_template_variables(text)
+
+
+@functools.lru_cache(maxsize=_TEMPLATE_CACHE_SIZE)
+def _scan_template_variables(text: str) -> FrozenSet[str]:
+    """Scan string for template variables, memoised per template string.
+
+    The same template strings recur across steps and matrix jobs.
+    """
+    # Variable names are a small vocabulary repeated across a workflow
+    return frozenset(
+        sys.intern(match.group(1)) for match in _TEMPLATE_RE.finditer(text)
+    )
+
+
+class _TemplateCollectingLoader(_YAML_LOADER):  # type: ignore
+    """Safe YAML loader recording template variables in string values.
+
+    Mapping keys are not scanned, matching template validation of parsed
+    workflows which only considers values.
+    """
+
+    def __init__(self, stream: Any) -> None:
+        super().__init__(stream)
+        self.template_variables: Set[str] = set()
+        self._key_nodes: Set[int] = set()
+
+    def construct_mapping(self, node: Any, deep: bool = False) -> Any:
+        """Construct mapping, remembering which nodes are keys."""
+        if isinstance(node, yaml.MappingNode):
+            self.flatten_mapping(node)
+            self._key_nodes.update(id(key) for key, _ in node.value)
+        return super().construct_mapping(node, deep=deep)
+
+    def construct_yaml_str(self, node: Any) -> Any:
+        """Construct string, collecting any template variables it uses."""
+        value = super().construct_yaml_str(node)
+        if id(node) not in self._key_nodes:
+            self.template_variables.update(extract_template_variables(value))
+        return value
+
+
+_TemplateCollectingLoader.add_constructor(
+    "tag:yaml.org,2002:str", _TemplateCollectingLoader.construct_yaml_str
+)
+
 
 class WorkflowValidationError(Exception):
     """Raised when workflow validation against JSON Schema fails."""
@@ -40,12 +117,7 @@ def load_schema(
     Raises:
         WorkflowValidationError: If schema file cannot be loaded
     """
-    if schema_path is None:
-        file_path = (
-            Path(__file__).parent / "schemas" / "causaliq-workflow.json"
-        )
-    else:
-        file_path = Path(schema_path)
+    file_path = _schema_file_path(schema_path)
 
     try:
         with open(file_path, "r", encoding="utf-8") as f:
@@ -61,6 +133,56 @@ def load_schema(
         raise WorkflowValidationError(f"Invalid JSON in schema: {e}")
 
 
+def _schema_file_path(schema_path: Optional[Union[str, Path]]) -> Path:
+    """Return path to schema file, defaulting to the package schema."""
+    if schema_path is None:
+        return Path(__file__).parent / "schemas" / "causaliq-workflow.json"
+    return Path(schema_path)
+
+
+def _build_validator(file_path: Path) -> Any:
+    """Load schema and build a checked jsonschema validator for it."""
+    import jsonschema
+
+    schema = load_schema(file_path)
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
+
+@functools.lru_cache(maxsize=_VALIDATOR_CACHE_SIZE)
+def _cached_validator(file_path: Path, mtime_ns: int, size: int) -> Any:
+    """Build validator once per schema file version.
+
+    The modification time and size only form part of the cache key, so
+    that an edited schema file is reloaded.
+    """
+    return _build_validator(file_path)
+
+
+def _get_validator(schema_path: Optional[Union[str, Path]]) -> Any:
+    """Return validator for schema, reusing one compiled earlier if possible.
+
+    Args:
+        schema_path: Optional path to custom schema file
+
+    Returns:
+        jsonschema validator instance for the schema
+
+    Raises:
+        WorkflowValidationError: If schema file cannot be loaded
+    """
+    file_path = _schema_file_path(schema_path)
+    try:
+        stat = file_path.stat()
+    except OSError:
+        # Not cacheable - load_schema reports why the file is unusable
+        return _build_validator(file_path)
+    return _cached_validator(
+        file_path.resolve(), stat.st_mtime_ns, stat.st_size
+    )
+
+
 def validate_workflow(
     workflow: Dict[str, Any], schema_path: Optional[Union[str, Path]] = None
 ) -> bool:
@@ -83,18 +205,19 @@ def validate_workflow(
             "jsonschema library required: pip install jsonschema"
         )
 
-    schema = load_schema(schema_path)
+    validator = _get_validator(schema_path)
 
-    try:
-        jsonschema.validate(workflow, schema)
+    # Report most relevant error, as jsonschema.validate would
+    error = jsonschema.exceptions.best_match(validator.iter_errors(workflow))
+    if error is None:
         return True
-    except jsonschema.ValidationError as e:
-        # Convert absolute_path to string for error reporting
-        path_str = ".".join(str(p) for p in e.absolute_path)
-        raise WorkflowValidationError(
-            f"Workflow validation failed: {e.message}",
-            schema_path=path_str,
-        )
+
+    # Convert absolute_path to string for error reporting
+    path_str = ".".join(str(p) for p in error.absolute_path)
+    raise WorkflowValidationError(
+        f"Workflow validation failed: {error.message}",
+        schema_path=path_str,
+    )
 
 
 def load_workflow_file(file_path: Union[str, Path]) -> Dict[str, Any]:
@@ -106,17 +229,42 @@ def load_workflow_file(file_path: Union[str, Path]) -> Dict[str, Any]:
     Returns:
         Parsed workflow dictionary
 
+    Raises:
+        WorkflowValidationError: If file cannot be loaded
+    """
+    return load_workflow_file_with_templates(file_path)[0]
+
+
+def load_workflow_file_with_templates(
+    file_path: Union[str, Path],
+) -> Tuple[Dict[str, Any], Set[str]]:
+    """Load workflow from YAML file, collecting template variables used.
+
+    Template variables are collected from string values as the YAML is
+    constructed, so no separate pass over the parsed workflow is needed.
+
+    Args:
+        file_path: Path to workflow YAML file
+
+    Returns:
+        Tuple of parsed workflow dictionary and set of template variable
+        names used in its string values
+
     Raises:
         WorkflowValidationError: If file cannot be loaded
     """
     try:
         with open(file_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            loader = _TemplateCollectingLoader(f)
+            try:
+                data = loader.get_single_data()
+            finally:
+                loader.dispose()
             if not isinstance(data, dict):
                 raise WorkflowValidationError(
                     f"Workflow must be YAML object, got {type(data).__name__}"
                 )
-            return data
+            return data, loader.template_variables
     except FileNotFoundError:
         raise WorkflowValidationError(f"Workflow file not found: {file_path}")
     except yaml.YAMLError as e:
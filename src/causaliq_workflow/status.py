@@ -54,34 +54,54 @@ class TaskStatus(Enum):
     TIMED_OUT = "TIMED_OUT"
     """Task exceeded configured timeout."""
 
+    # Members are singletons compared by identity, so the C-level identity
+    # hash is consistent with equality and avoids Enum's Python-level
+    # __hash__ on every set or dict lookup
+    __hash__ = object.__hash__
+
     @property
     def is_success(self) -> bool:
         """Return True if status indicates successful execution."""
-        return self in {
-            self.EXECUTES,
-            self.WOULD_EXECUTE,
-            self.SKIPS,
-            self.WOULD_SKIP,
-            self.IDENTICAL,
-            self.DIFFERENT,
-        }
+        return self in _SUCCESS_STATUSES
 
     @property
     def is_error(self) -> bool:
         """Return True if status indicates an error condition."""
-        return self in {
-            self.INVALID_USES,
-            self.INVALID_PARAMETER,
-            self.FAILED,
-            self.TIMED_OUT,
-        }
+        return self in _ERROR_STATUSES
 
     @property
     def is_execution(self) -> bool:
         """Return True if status indicates actual execution occurred."""
-        return self in {self.EXECUTES, self.IDENTICAL, self.DIFFERENT}
+        return self in _EXECUTION_STATUSES
 
     @property
     def is_dry_run(self) -> bool:
         """Return True if status is for dry-run mode."""
-        return self in {self.WOULD_EXECUTE, self.WOULD_SKIP}
+        return self in _DRY_RUN_STATUSES
+
+
+# Status categories, built once rather than on every property access
+_SUCCESS_STATUSES = frozenset(
+    {
+        TaskStatus.EXECUTES,
+        TaskStatus.WOULD_EXECUTE,
+        TaskStatus.SKIPS,
+        TaskStatus.WOULD_SKIP,
+        TaskStatus.IDENTICAL,
+        TaskStatus.DIFFERENT,
+    }
+)
+_ERROR_STATUSES = frozenset(
+    {
+        TaskStatus.INVALID_USES,
+        TaskStatus.INVALID_PARAMETER,
+        TaskStatus.FAILED,
+        TaskStatus.TIMED_OUT,
+    }
+)
+_EXECUTION_STATUSES = frozenset(
+    {TaskStatus.EXECUTES, TaskStatus.IDENTICAL, TaskStatus.DIFFERENT}
+)
+_DRY_RUN_STATUSES = frozenset(
+    {TaskStatus.WOULD_EXECUTE, TaskStatus.WOULD_SKIP}
+)
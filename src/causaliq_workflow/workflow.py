@@ -5,18 +5,72 @@ Provides parsing and execution of GitHub Actions-style YAML workflows with
 matrix strategy support for causal discovery experiments.
 """
 
+import copy
+import functools
 import itertools
-import re
+import os
+from collections import OrderedDict
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Set, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+    overload,
+)
 
 from causaliq_workflow.registry import ActionRegistry, WorkflowContext
 from causaliq_workflow.schema import (
     WorkflowValidationError,
-    load_workflow_file,
+    extract_template_variables,
+    load_workflow_file_with_templates,
     validate_workflow,
 )
 
+# Variables always available to templates
+_BASE_CONTEXT = frozenset(("id", "description"))
+
+# Top-level workflow fields which are not workflow variables
+_WORKFLOW_METADATA = frozenset(("id", "description", "matrix", "steps"))
+
+# Parsed, schema-validated and template-checked workflows keyed by
+# (resolved path, modification time, size), least recently used first
+_PARSE_CACHE: "OrderedDict[Tuple[Path, int, int], Dict[str, Any]]" = (
+    OrderedDict()
+)
+_PARSE_CACHE_SIZE = 32
+
+# Matrix jobs submitted ahead per worker process by run_matrix
+_RUN_MATRIX_JOBS_PER_WORKER = 2
+
+# Number of generated job builders kept, one per tuple of matrix variables
+_JOB_BUILDER_CACHE_SIZE = 64
+
+
+def _parse_cache_key(
+    workflow_path: Union[str, Path],
+) -> Optional[Tuple[Path, int, int]]:
+    """Return parse cache key for workflow file, or None if not on disk."""
+    try:
+        path = Path(workflow_path).resolve()
+        stat = path.stat()
+    except OSError:
+        return None
+    return (path, stat.st_mtime_ns, stat.st_size)
+
 
 class WorkflowExecutionError(Exception):
     """Raised when workflow execution fails."""
@@ -24,6 +78,111 @@ class WorkflowExecutionError(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=_JOB_BUILDER_CACHE_SIZE)
+def _job_builder(
+    variables: Tuple[str, ...],
+) -> Callable[[Sequence[Any]], Dict[str, Any]]:
+    """Return function building a job dict from a tuple of matrix values.
+
+    For string variable names a dict display specialised to the names is
+    generated, which is around twice as fast per job as dict(zip(...)).
+
+    Args:
+        variables: Matrix variable names in matrix order
+
+    Returns:
+        Function mapping a combination of values to a job configuration
+    """
+    if not all(type(name) is str for name in variables):
+        return lambda combination: dict(zip(variables, combination))
+
+    # repr() of a str is a valid, safely quoted literal for the key
+    items = ", ".join(
+        f"{name!r}: combination[{i}]" for i, name in enumerate(variables)
+    )
+    namespace: Dict[str, Any] = {}
+    exec(f"def build(combination): return {{{items}}}", namespace)
+    builder: Callable[[Sequence[Any]], Dict[str, Any]] = namespace["build"]
+    return builder
+
+
+class MatrixJobs(Sequence[Dict[str, Any]]):
+    """Lazy sequence of job configurations expanded from a matrix.
+
+    Supports len(), indexing and iteration in cartesian product order
+    without materialising every job. An empty matrix expands to a single
+    job with no matrix variables.
+
+    Args:
+        matrix: Dictionary mapping variable names to lists of values
+
+    Raises:
+        WorkflowExecutionError: If matrix values are not lists of values
+    """
+
+    __slots__ = ("_variables", "_value_lists", "_length")
+
+    def __init__(self, matrix: Dict[str, List[Any]]) -> None:
+        """Capture matrix variable names and values."""
+        try:
+            # Single ordered walk over matrix yields names and value lists
+            variables, value_lists = (
+                zip(*matrix.items()) if matrix else ((), ())
+            )
+            self._variables: Tuple[str, ...] = tuple(variables)
+            self._value_lists: Tuple[Tuple[Any, ...], ...] = tuple(
+                tuple(values) for values in value_lists
+            )
+        except Exception as e:
+            raise WorkflowExecutionError(
+                f"Matrix expansion failed: {e}"
+            ) from e
+
+        self._length = 1
+        for values in self._value_lists:
+            self._length *= len(values)
+
+    def __len__(self) -> int:
+        """Return number of jobs, the product of value list lengths."""
+        return self._length
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over jobs, building each one as it is reached."""
+        # Value lists were validated as tuples in __init__, so the cartesian
+        # product of all combinations cannot fail here
+        combinations = itertools.product(*self._value_lists)
+        return map(_job_builder(self._variables), combinations)
+
+    @overload
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        """Return job at integer index."""
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Dict[str, Any]]:
+        """Return list of jobs selected by slice."""
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """Return job at index, or list of jobs for a slice."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("matrix job index out of range")
+
+        # Decode index into value positions, last variable varying fastest
+        combination: List[Any] = []
+        for values in reversed(self._value_lists):
+            index, position = divmod(index, len(values))
+            combination.append(values[position])
+        combination.reverse()
+
+        return _job_builder(self._variables)(combination)
+
+
 class WorkflowExecutor:
     """Parse and execute GitHub Actions-style workflows with matrix expansion.
 
@@ -33,6 +192,8 @@ class WorkflowExecutor:
     parameterised experiments using flexible action parameter templating.
     """
 
+    __slots__ = ("action_registry",)
+
     def __init__(self) -> None:
         """Initialize workflow executor with action registry."""
         self.action_registry = ActionRegistry()
@@ -53,9 +214,7 @@ class WorkflowExecutor:
             WorkflowExecutionError: If workflow parsing or validation fails
         """
         try:
-            workflow = load_workflow_file(workflow_path)
-            validate_workflow(workflow)
-            self._validate_template_variables(workflow)
+            workflow = self._load_workflow(workflow_path)
 
             # Validate all actions exist and can run
             self._validate_workflow_actions(workflow, mode)
@@ -69,6 +228,39 @@ class WorkflowExecutor:
                 f"Unexpected error parsing workflow: {e}"
             ) from e
 
+    def _load_workflow(
+        self, workflow_path: Union[str, Path]
+    ) -> Dict[str, Any]:
+        """Load workflow file with schema and template variable validation.
+
+        Results are cached on the file's resolved path, modification time
+        and size, so unchanged files are only parsed once per process.
+        Callers always receive their own copy of the workflow.
+
+        Args:
+            workflow_path: Path to workflow YAML file
+
+        Returns:
+            Parsed and validated workflow dictionary
+        """
+        key = _parse_cache_key(workflow_path)
+        if key is not None and key in _PARSE_CACHE:
+            _PARSE_CACHE.move_to_end(key)
+            return copy.deepcopy(_PARSE_CACHE[key])
+
+        workflow, used_variables = load_workflow_file_with_templates(
+            workflow_path
+        )
+        validate_workflow(workflow)
+        self._validate_template_variables(workflow, used_variables)
+
+        if key is not None:
+            _PARSE_CACHE[key] = copy.deepcopy(workflow)
+            while len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+                _PARSE_CACHE.popitem(last=False)
+
+        return workflow
+
     def expand_matrix(
         self, matrix: Dict[str, List[Any]]
     ) -> List[Dict[str, Any]]:
@@ -86,104 +278,163 @@ class WorkflowExecutor:
         Raises:
             WorkflowExecutionError: If matrix expansion fails
         """
-        if not matrix:
-            return [{}]
+        return list(self.iter_matrix(matrix))
 
-        try:
-            # Get variable names and value lists
-            variables = list(matrix.keys())
-            value_lists = list(matrix.values())
+    def iter_matrix(
+        self, matrix: Dict[str, List[Any]]
+    ) -> Iterator[Dict[str, Any]]:
+        """Lazily expand matrix variables into job configurations.
 
-            # Generate cartesian product of all combinations
-            combinations = list(itertools.product(*value_lists))
+        Yields the same job configurations, in the same order, as
+        expand_matrix without materialising the full cartesian product.
 
-            # Create job configurations
-            jobs = []
-            for combination in combinations:
-                job = dict(zip(variables, combination))
-                jobs.append(job)
+        Args:
+            matrix: Dictionary mapping variable names to lists of values
 
-            return jobs
+        Returns:
+            Iterator over job configurations with matrix variables expanded
 
-        except Exception as e:
-            raise WorkflowExecutionError(
-                f"Matrix expansion failed: {e}"
-            ) from e
+        Raises:
+            WorkflowExecutionError: If matrix expansion fails
+        """
+        return iter(MatrixJobs(matrix))
+
+    def run_matrix(
+        self,
+        workflow: Dict[str, Any],
+        runner: Callable[[Dict[str, Any], Dict[str, Any]], Any],
+        max_workers: Optional[int] = None,
+    ) -> Iterator[Tuple[Dict[str, Any], Any]]:
+        """Run independent matrix jobs concurrently in worker processes.
+
+        Each expanded matrix job is submitted to a process pool, since
+        causal discovery runners are typically CPU-bound. Results are
+        yielded as jobs complete, so ordering is not guaranteed. Jobs are
+        drawn lazily from the matrix, with at most two per worker submitted
+        at a time. If a job fails or the generator is closed early, queued
+        jobs are cancelled.
+
+        Args:
+            workflow: Parsed workflow dictionary
+            runner: Picklable callable taking (job, workflow) and returning
+                the job result
+            max_workers: Maximum number of worker processes (default: number
+                of processors)
+
+        Yields:
+            Tuples of job configuration and its runner result
 
-    def _extract_template_variables(self, text: Any) -> Set[str]:
+        Raises:
+            WorkflowExecutionError: If matrix expansion or any job fails
+        """
+        jobs = self.iter_matrix(workflow.get("matrix", {}))
+        workers = max_workers if max_workers is not None else os.cpu_count()
+
+        pool = ProcessPoolExecutor(max_workers=workers)
+        try:
+            # Submit a bounded window of jobs so that large sweeps are not
+            # all pickled and queued up front
+            window = _RUN_MATRIX_JOBS_PER_WORKER * (workers or 1)
+            pending: Dict[Future[Any], Dict[str, Any]] = {
+                pool.submit(runner, job, workflow): job
+                for job in itertools.islice(jobs, window)
+            }
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        raise WorkflowExecutionError(
+                            f"Matrix job {job} failed: {e}"
+                        ) from e
+
+                    # Refill the window before handing back the result
+                    for next_job in itertools.islice(jobs, 1):
+                        pending[pool.submit(runner, next_job, workflow)] = (
+                            next_job
+                        )
+                    yield job, result
+        finally:
+            # On failure or early close, don't run jobs still queued
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _extract_template_variables(self, text: object) -> FrozenSet[str]:
         """Extract template variables from a string.
 
-        Finds all {{variable}} patterns and returns variable names.
+        Finds all {{variable}} patterns and returns variable names. Results
+        are shared between calls, so must not be modified.
 
         Args:
             text: String that may contain {{variable}} patterns
 
         Returns:
-            Set of variable names found in templates
+            Frozen set of variable names found in templates
         """
         if not isinstance(text, str):
-            return set()
+            return frozenset()
 
-        # Pattern matches {{variable_name}} with alphanumeric, _, -
-        pattern = r"\{\{([a-zA-Z_][a-zA-Z0-9_-]*)\}\}"
-        matches = re.findall(pattern, text)
-        return set(matches)
+        return extract_template_variables(text)
 
-    def _validate_template_variables(self, workflow: Dict[str, Any]) -> None:
+    def _validate_template_variables(
+        self,
+        workflow: Dict[str, Any],
+        used_variables: Optional[Set[str]] = None,
+    ) -> None:
         """Validate that all template variables in workflow exist in context.
 
         Args:
             workflow: Parsed workflow dictionary
+            used_variables: Template variables used in workflow, if already
+                collected whilst loading it. Otherwise the workflow is
+                scanned, as for workflow dictionaries not loaded from YAML
 
         Raises:
             WorkflowExecutionError: If unknown template variables found
         """
-        # Build available context
-        available_variables = {"id", "description"}
-
-        # Add workflow variables (excluding workflow metadata fields)
-        workflow_vars = {
-            k
-            for k, v in workflow.items()
-            if k not in {"id", "description", "matrix", "steps"}
-        }
-        available_variables.update(workflow_vars)
-
-        # Add matrix variables if present
-        if "matrix" in workflow:
-            available_variables.update(workflow["matrix"].keys())
+        # Build available context from base, workflow and matrix variables
+        available_variables = _BASE_CONTEXT.union(
+            (k for k in workflow if k not in _WORKFLOW_METADATA),
+            workflow.get("matrix", {}),
+        )
 
         # Collect all template variables used in workflow
-        used_variables: Set[str] = set()
-        self._collect_template_variables(workflow, used_variables)
-
-        # Check for unknown variables
-        unknown_variables = used_variables - available_variables
-        if unknown_variables:
-            unknown_list = sorted(unknown_variables)
-            available_list = sorted(available_variables)
+        if used_variables is None:
+            used_variables = set()
+            self._collect_template_variables(workflow, used_variables)
+
+        # Check for unknown variables, only building message on failure
+        if not used_variables.issubset(available_variables):
             raise WorkflowExecutionError(
-                f"Unknown template variables: {unknown_list}. "
-                f"Available variables: {available_list}"
+                "Unknown template variables: "
+                f"{sorted(used_variables - available_variables)}. "
+                f"Available variables: {sorted(available_variables)}"
             )
 
     def _collect_template_variables(
-        self, obj: Any, used_variables: Set[str]
+        self, obj: object, used_variables: Set[str]
     ) -> None:
-        """Recursively collect template variables from workflow object.
+        """Collect template variables from workflow object.
+
+        Walks the object iteratively with an explicit stack so that deeply
+        nested workflows do not hit the interpreter recursion limit.
 
         Args:
             obj: Workflow object (dict, list, or string) to scan
             used_variables: Set to collect found variables into
         """
-        if isinstance(obj, dict):
-            for value in obj.values():
-                self._collect_template_variables(value, used_variables)
-        elif isinstance(obj, list):
-            for item in obj:
-                self._collect_template_variables(item, used_variables)
-        elif isinstance(obj, str):
-            used_variables.update(self._extract_template_variables(obj))
+        stack: List[object] = [obj]
+        while stack:
+            current = stack.pop()
+            if isinstance(current, dict):
+                stack.extend(current.values())
+            elif isinstance(current, list):
+                stack.extend(current)
+            elif isinstance(current, str):
+                used_variables.update(
+                    self._extract_template_variables(current)
+                )
 
     def _resolve_template_variables(
         self, obj: Any, variables: Dict[str, Any]
@@ -208,6 +459,9 @@ class WorkflowExecutor:
                 for item in obj
             ]
         elif isinstance(obj, str):
+            # Most values are static, so skip template handling cheaply
+            if "{{" not in obj:
+                return obj
             result = obj
             for var in self._extract_template_variables(obj):
                 if var in variables:
@@ -234,7 +488,7 @@ class WorkflowExecutor:
 
         for key, value in workflow.items():
             # Skip workflow metadata fields
-            if key in {"id", "description", "matrix", "steps"}:
+            if key in _WORKFLOW_METADATA:
                 continue
 
             # Check for None values (required variables)
@@ -308,10 +562,9 @@ class WorkflowExecutor:
         try:
             # Expand matrix into individual jobs
             matrix = workflow.get("matrix", {})
-            jobs = self.expand_matrix(matrix)
 
             results = []
-            for job_index, job in enumerate(jobs):
+            for job in self.iter_matrix(matrix):
                 # Create workflow context
                 context = WorkflowContext(
                     mode=mode,
@@ -292,3 +292,30 @@ def test_ensure_file_stream_idempotent():
         # Cleanup after test
         if log_path.exists():
             log_path.unlink()
+
+
+# Test WorkflowLogger buffers file writes in 64 KiB blocks until close
+def test_workflow_logger_buffers_file_writes():
+    """WorkflowLogger holds 32 KiB of writes, beyond default buffering."""
+    log_path = TEST_DATA_DIR / "buffered.log"
+    lines = ["x" * 63 + "\n"] * 512
+
+    # Clean up from any previous test runs
+    if log_path.exists():
+        log_path.unlink()
+
+    try:
+        with WorkflowLogger(log_file=log_path, terminal=False) as logger:
+            logger._ensure_file_stream()
+            for line in lines:
+                logger._file_stream.write(line)
+
+            # 32 KiB exceeds the default 8 KiB buffer, but not 64 KiB
+            assert log_path.stat().st_size == 0
+
+        assert log_path.read_text(encoding="utf-8") == "".join(lines)
+
+    finally:
+        # Cleanup after test
+        if log_path.exists():
+            log_path.unlink()
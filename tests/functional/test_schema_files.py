@@ -9,8 +9,11 @@ import test_action  # noqa: F401
 
 from causaliq_workflow.schema import (
     WorkflowValidationError,
+    _get_validator,
     load_schema,
     load_workflow_file,
+    load_workflow_file_with_templates,
+    validate_workflow,
 )
 
 # Test data directory path
@@ -107,6 +110,26 @@ def test_load_workflow_file_with_path_object():
     assert len(workflow["steps"]) == 2
 
 
+# Test loading workflow file together with its template variables
+def test_load_workflow_file_with_templates(tmp_path):
+    """Test loading workflow collects template variables from values."""
+    workflow_path = tmp_path / "templates.yml"
+    workflow_path.write_text(
+        "id: templates-001\n"
+        "steps:\n"
+        "  - uses: test_action\n"
+        "    with:\n"
+        "      data: /data/{{dataset}}.csv\n"
+        "      '{{key_only}}': 1\n"
+        '      result: "/results/{{id}}_\\x7b{algorithm}}.xml"\n'
+    )
+
+    workflow, used_variables = load_workflow_file_with_templates(workflow_path)
+
+    assert workflow == load_workflow_file(workflow_path)
+    assert used_variables == {"dataset", "id", "algorithm"}
+
+
 # Test loading workflow when file does not exist
 def test_workflow_file_not_found():
     """Test error handling when workflow file not found."""
@@ -142,3 +165,28 @@ def test_non_object_yaml_workflow():
         assert "Workflow must be YAML object" in str(exc_info.value)
     finally:
         invalid_workflow.unlink()  # Clean up test file
+
+
+# Test compiled schema validators are reused until the schema file changes
+def test_validate_workflow_reuses_compiled_validator(tmp_path):
+    """Test validator is cached per schema file and rebuilt when edited."""
+    schema_path = tmp_path / "schema.json"
+    schema_path.write_text('{"type": "object", "required": ["id"]}')
+
+    first = _get_validator(schema_path)
+    assert _get_validator(str(schema_path)) is first
+    assert validate_workflow({"id": "wf"}, schema_path) is True
+
+    schema_path.write_text('{"type": "object", "required": ["steps"]}')
+    assert _get_validator(schema_path) is not first
+    with pytest.raises(WorkflowValidationError) as exc_info:
+        validate_workflow({"id": "wf"}, schema_path)
+    assert "'steps' is a required property" in str(exc_info.value)
+
+
+# Test validation against a missing schema file
+def test_validate_workflow_schema_file_not_found(tmp_path):
+    """Test validation reports missing schema file rather than caching."""
+    with pytest.raises(WorkflowValidationError) as exc_info:
+        validate_workflow({"id": "wf"}, tmp_path / "missing.json")
+    assert "Schema file not found" in str(exc_info.value)
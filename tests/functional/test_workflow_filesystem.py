@@ -4,6 +4,8 @@ Functional tests for WorkflowExecutor.
 Tests workflow parsing with real filesystem operations using tracked test data.
 """
 
+import time
+from collections import OrderedDict
 from pathlib import Path
 
 import pytest
@@ -153,3 +155,103 @@ def test_parse_workflow_with_invalid_template_variables():
     error_msg = str(exc_info.value)
     assert "Unknown template variables" in error_msg
     assert "unknown_variable" in error_msg or "missing_alpha" in error_msg
+
+
+# Test repeated parsing of an unchanged file uses the parse cache
+def test_parse_workflow_cached_until_file_changes(tmp_path, monkeypatch):
+    """Test parse cache returns copies and is invalidated by file changes."""
+    workflow_path = tmp_path / "cached_workflow.yml"
+    workflow_path.write_text(
+        "id: cached-001\n"
+        "description: Cached workflow\n"
+        "steps:\n"
+        "  - uses: test_action\n"
+    )
+
+    executor = WorkflowExecutor()
+    first = executor.parse_workflow(workflow_path)
+
+    # Unchanged file is served from cache without reloading YAML
+    def fail_load(path):
+        raise AssertionError("workflow file should not be reloaded")
+
+    with monkeypatch.context() as m:
+        m.setattr(
+            "causaliq_workflow.workflow.load_workflow_file_with_templates",
+            fail_load,
+        )
+        second = executor.parse_workflow(str(workflow_path))
+
+    assert second == first
+    assert second is not first
+    second["steps"].clear()
+    assert executor.parse_workflow(workflow_path) == first
+
+    # Changing the file invalidates the cached entry
+    workflow_path.write_text(
+        "id: cached-002\n"
+        "description: Changed cached workflow\n"
+        "steps:\n"
+        "  - uses: test_action\n"
+    )
+    assert executor.parse_workflow(workflow_path)["id"] == "cached-002"
+
+
+# Test parse cache evicts least recently used entries
+def test_parse_workflow_cache_eviction(monkeypatch):
+    """Test parse cache is bounded in size."""
+    from causaliq_workflow import workflow as workflow_module
+
+    test_data_dir = (
+        Path(__file__).parent.parent / "data" / "functional" / "workflow"
+    )
+    monkeypatch.setattr(workflow_module, "_PARSE_CACHE", OrderedDict())
+    monkeypatch.setattr(workflow_module, "_PARSE_CACHE_SIZE", 1)
+
+    executor = WorkflowExecutor()
+    executor.parse_workflow(test_data_dir / "valid_workflow.yml")
+    executor.parse_workflow(test_data_dir / "matrix_workflow.yml")
+
+    assert len(workflow_module._PARSE_CACHE) == 1
+    cached_path, _, _ = next(iter(workflow_module._PARSE_CACHE))
+    assert cached_path.name == "matrix_workflow.yml"
+
+
+def _record_alpha(job, workflow):
+    """Matrix job runner recording each job run - must be picklable."""
+    if job["alpha"] < 0:
+        raise ValueError("negative alpha")
+    time.sleep(0.2)
+    (Path(workflow["output"]) / f"job-{job['alpha']}").touch()
+    return job["alpha"]
+
+
+# Test job failure cancels matrix jobs still queued
+def test_run_matrix_failure_cancels_queued_jobs(tmp_path):
+    """Test a failing job surfaces without running every queued job."""
+    workflow = {
+        "id": "matrix-run",
+        "output": str(tmp_path),
+        "matrix": {"alpha": [-1, 1, 2, 3, 4, 5, 6, 7, 8]},
+    }
+
+    executor = WorkflowExecutor()
+    with pytest.raises(WorkflowExecutionError):
+        list(executor.run_matrix(workflow, _record_alpha, max_workers=1))
+    assert len(list(tmp_path.iterdir())) < 8
+
+
+# Test closing run_matrix early cancels matrix jobs still queued
+def test_run_matrix_close_cancels_queued_jobs(tmp_path):
+    """Test closing the results generator early stops queued jobs."""
+    workflow = {
+        "id": "matrix-run",
+        "output": str(tmp_path),
+        "matrix": {"alpha": [1, 2, 3, 4, 5, 6, 7, 8]},
+    }
+
+    executor = WorkflowExecutor()
+    results = executor.run_matrix(workflow, _record_alpha, max_workers=1)
+    next(results)
+    results.close()
+    assert len(list(tmp_path.iterdir())) < 8
@@ -180,3 +180,79 @@ def test_registry_line_76_builtin_module_skip(monkeypatch):
 
     # Call list_actions_by_package which contains line 256
     registry.list_actions_by_package()
+
+
+# Test package grouping is cached until registered actions change
+def test_list_actions_by_package_tracks_changes():
+    from test_action import CausalIQAction as TestAction
+
+    registry = ActionRegistry()
+    packages = registry.list_actions_by_package()
+    assert "test_action" in packages["test_action"]
+
+    # Returned grouping is a copy that callers may modify freely
+    packages["test_action"].clear()
+    assert "test_action" in registry.list_actions_by_package()["test_action"]
+
+    # Direct changes to registered actions are picked up
+    registry._actions["late_action"] = TestAction
+    assert "late_action" in registry.list_actions_by_package()["test_action"]
+    del registry._actions["late_action"]
+    assert "late_action" not in (
+        registry.list_actions_by_package()["test_action"]
+    )
+
+
+# Test lookup of package providing an action
+def test_get_action_package():
+    registry = ActionRegistry()
+
+    assert registry.get_action_package("test_action") == "test_action"
+
+    with pytest.raises(ActionRegistryError) as exc_info:
+        registry.get_action_package("nonexistent_action")
+    assert "Action 'nonexistent_action' not found" in str(exc_info.value)
+
+
+# Test action names set is reused until actions change
+def test_action_names_tracks_registered_actions():
+    from test_action import CausalIQAction as TestAction
+
+    registry = ActionRegistry()
+    names = registry.action_names
+
+    assert "test_action" in names
+    assert registry.action_names is names
+
+    registry._actions["extra_action"] = TestAction
+    assert registry.action_names == names | {"extra_action"}
+
+    registry._actions |= {"merged_action": TestAction}
+    assert "merged_action" in registry.action_names
+
+
+# Test every mutation of registered actions changes their version
+def test_actions_version_changes_on_mutation():
+    from test_action import CausalIQAction as TestAction
+
+    actions = ActionRegistry()._actions
+    mutations = [
+        lambda: actions.__setitem__("a", TestAction),
+        lambda: actions.update(b=TestAction),
+        lambda: actions.__ior__({"d": TestAction}),
+        lambda: actions.setdefault("c", TestAction),
+        lambda: actions.pop("c"),
+        lambda: actions.__delitem__("b"),
+        lambda: actions.popitem(),
+        lambda: actions.clear(),
+    ]
+    for mutate in mutations:
+        version = actions.version
+        mutate()
+        assert actions.version > version
+
+    # Failed removal leaves the version unchanged
+    version = actions.version
+    with pytest.raises(KeyError):
+        actions.pop("missing")
+    assert actions.version == version
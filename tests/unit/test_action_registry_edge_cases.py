@@ -31,7 +31,6 @@ class InvalidAction:
 # Test discovery handles None modules in sys.modules gracefully
 def test_discovery_with_module_none():
     # Create a registry and patch sys.modules to include None
-    original_modules = sys.modules.copy()
     try:
         # Add a None module to sys.modules
         sys.modules["test_none_module"] = None
@@ -44,9 +43,8 @@ def test_discovery_with_module_none():
         assert "test_none_module" not in actions
 
     finally:
-        # Restore original sys.modules
-        sys.modules.clear()
-        sys.modules.update(original_modules)
+        # Remove only the module added by this test
+        sys.modules.pop("test_none_module", None)
 
 
 # Test discovery skips built-in and standard library modules
@@ -56,7 +54,6 @@ def test_discovery_skips_builtin_modules():
     mock_builtin.__file__ = None
     mock_builtin.CausalIQAction = MockCausalIQAction
 
-    original_modules = sys.modules.copy()
     try:
         sys.modules["test_builtin"] = mock_builtin
 
@@ -67,8 +64,7 @@ def test_discovery_skips_builtin_modules():
         assert "test_builtin" not in actions
 
     finally:
-        sys.modules.clear()
-        sys.modules.update(original_modules)
+        sys.modules.pop("test_builtin", None)
 
 
 # Test discovery skips modules starting with underscore
@@ -78,7 +74,6 @@ def test_discovery_skips_underscore_modules():
     mock_private.__file__ = "/fake/path/_private_module.py"
     mock_private.CausalIQAction = MockCausalIQAction
 
-    original_modules = sys.modules.copy()
     try:
         sys.modules["_private_module"] = mock_private
 
@@ -89,8 +84,7 @@ def test_discovery_skips_underscore_modules():
         assert "_private_module" not in actions
 
     finally:
-        sys.modules.clear()
-        sys.modules.update(original_modules)
+        sys.modules.pop("_private_module", None)
 
 
 # Test discovery skips submodules of standard library
@@ -101,7 +95,6 @@ def test_discovery_skips_stdlib_submodules():
     mock_stdlib_sub.__file__ = "/fake/path/os/path/test.py"
     mock_stdlib_sub.CausalIQAction = MockCausalIQAction
 
-    original_modules = sys.modules.copy()
     try:
         sys.modules["os.path.test"] = mock_stdlib_sub
 
@@ -114,5 +107,23 @@ def test_discovery_skips_stdlib_submodules():
             assert actions["os"] == MockCausalIQAction
 
     finally:
-        sys.modules.clear()
-        sys.modules.update(original_modules)
+        sys.modules.pop("os.path.test", None)
+
+
+# Test discovery skips submodules of interpreter built-in modules
+def test_discovery_skips_builtin_submodules():
+    # 'sys' is compiled into every interpreter
+    mock_builtin_sub = ModuleType("sys.fake_submodule")
+    mock_builtin_sub.__file__ = "/fake/path/sys/fake_submodule.py"
+    mock_builtin_sub.CausalIQAction = MockCausalIQAction
+
+    sys.modules["sys.fake_submodule"] = mock_builtin_sub
+    try:
+        registry = ActionRegistry()
+        actions = registry.get_available_actions()
+
+        # Should not discover action from built-in module's submodule
+        assert "sys" not in actions
+
+    finally:
+        sys.modules.pop("sys.fake_submodule", None)
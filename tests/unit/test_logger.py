@@ -66,6 +66,16 @@ def test_workflow_logger_file_configuration():
     assert logger._file_stream is None
 
 
+# Test WorkflowLogger normalises string log file paths
+def test_workflow_logger_string_log_file():
+    """WorkflowLogger converts a string log file path to a Path."""
+    logger = WorkflowLogger(log_file="logs/test.log", terminal=False)
+
+    assert logger.log_file == Path("logs/test.log")
+    assert logger.is_file_logging is True
+    assert logger._file_stream is None
+
+
 # Test WorkflowLogger with all log levels
 @pytest.mark.parametrize(
     "log_level", [LogLevel.NONE, LogLevel.SUMMARY, LogLevel.ALL]
@@ -149,3 +159,16 @@ def test_workflow_logger_complex_configuration():
     assert logger.has_output_destinations is True
     # File should not be opened during initialization
     assert logger._file_stream is None
+
+
+# Test WorkflowLogger flags follow changes to output destinations
+def test_workflow_logger_flags_follow_reconfiguration():
+    """Output destination flags reflect terminal and log_file changes."""
+    logger = WorkflowLogger(terminal=True, log_file=Path("workflow.log"))
+
+    logger.terminal = False
+    logger.log_file = None
+
+    assert logger.is_terminal_logging is False
+    assert logger.is_file_logging is False
+    assert logger.has_output_destinations is False
@@ -25,7 +25,6 @@ def test_underscore_module_skip():
     mock_private.CausalIQAction = CausalIQAction
 
     # Add to sys.modules temporarily
-    original_modules = dict(sys.modules)
     try:
         sys.modules["_private_test"] = mock_private
 
@@ -37,9 +36,8 @@ def test_underscore_module_skip():
         assert "_private_test" not in actions
 
     finally:
-        # Restore original modules
-        sys.modules.clear()
-        sys.modules.update(original_modules)
+        # Remove only the module added by this test
+        sys.modules.pop("_private_test", None)
 
 
 # Test direct call to _scan_module_for_actions (line 76)
@@ -169,3 +167,23 @@ def test_registry_lines_64_76_256(monkeypatch):
     setattr(mock_module, "ProblematicAction", ProblematicAction)
     result = registry._scan_module_for_actions("test_module", mock_module)
     assert result is None
+
+
+# Test reassigned CausalIQAction is picked up by later scans
+def test_scan_module_picks_up_reassigned_action():
+    class ReplacementAction(CausalIQAction):
+        name = "replacement-action"
+
+    test_module = ModuleType("reassign_test")
+    test_module.__file__ = "/fake/reassign_test.py"
+    test_module.CausalIQAction = CausalIQAction
+
+    registry = ActionRegistry()
+    registry._scan_module_for_actions("reassign_test", test_module)
+    assert registry.get_action_class("reassign_test") is CausalIQAction
+
+    # As after importlib.reload, the same module object has a new class
+    test_module.CausalIQAction = ReplacementAction
+    other = ActionRegistry()
+    other._scan_module_for_actions("reassign_test", test_module)
+    assert other.get_action_class("reassign_test") is ReplacementAction
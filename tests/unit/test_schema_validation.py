@@ -4,7 +4,11 @@ import sys
 
 import pytest
 
-from causaliq_workflow.schema import WorkflowValidationError, validate_workflow
+from causaliq_workflow.schema import (
+    WorkflowValidationError,
+    extract_template_variables,
+    validate_workflow,
+)
 
 
 # Test WorkflowValidationError exception creation
@@ -259,13 +263,10 @@ def test_invalid_with_parameter_name():
 # Test jsonschema ImportError handling
 def test_schema_jsonschema_import_error():
     # Temporarily replace the import to simulate ImportError
-    original_modules = dict(sys.modules)
+    # Remove jsonschema from modules if present, keeping it for restore
+    original_jsonschema = sys.modules.pop("jsonschema", None)
 
     try:
-        # Remove jsonschema from modules if present
-        if "jsonschema" in sys.modules:
-            del sys.modules["jsonschema"]
-
         # Mock __import__ to raise ImportError for jsonschema
         original_import = __builtins__["__import__"]
 
@@ -287,5 +288,18 @@ def test_schema_jsonschema_import_error():
     finally:
         # Restore original state
         __builtins__["__import__"] = original_import
-        sys.modules.clear()
-        sys.modules.update(original_modules)
+        if original_jsonschema is not None:
+            sys.modules["jsonschema"] = original_jsonschema
+
+
+# Test template variable extraction shared by loader and executor
+def test_extract_template_variables():
+    """Test extraction returns interned names and skips static strings."""
+    variables = extract_template_variables(
+        "/results/{{id}}/{{dataset}}_{{bad var}}.xml"
+    )
+    assert variables == frozenset({"id", "dataset"})
+    assert all(name is sys.intern(name) for name in variables)
+
+    assert extract_template_variables("/results/static.xml") == frozenset()
+    assert extract_template_variables("{{}} {incomplete}}") == frozenset()
@@ -2,8 +2,15 @@
 
 import pytest
 
-from causaliq_workflow.schema import WorkflowValidationError
-from causaliq_workflow.workflow import WorkflowExecutionError, WorkflowExecutor
+from causaliq_workflow.schema import (
+    WorkflowValidationError,
+    _scan_template_variables,
+)
+from causaliq_workflow.workflow import (
+    MatrixJobs,
+    WorkflowExecutionError,
+    WorkflowExecutor,
+)
 
 
 # Test WorkflowExecutionError exception creation
@@ -20,14 +27,14 @@ def test_parse_workflow_success(monkeypatch):
 
     def fake_load_workflow_file(path):
         assert path == "/path/to/workflow.yml"
-        return workflow_data
+        return workflow_data, set()
 
     def fake_validate_workflow(data):
         assert data == workflow_data
         return True
 
     monkeypatch.setattr(
-        "causaliq_workflow.workflow.load_workflow_file",
+        "causaliq_workflow.workflow.load_workflow_file_with_templates",
         fake_load_workflow_file,
     )
     monkeypatch.setattr(
@@ -45,14 +52,14 @@ def test_parse_workflow_validation_error(monkeypatch):
 
     def fake_load_workflow_file(path):
         assert path == "/path/to/workflow.yml"
-        return workflow_data
+        return workflow_data, set()
 
     def fake_validate_workflow(data):
         assert data == workflow_data
         raise WorkflowValidationError("Missing steps field")
 
     monkeypatch.setattr(
-        "causaliq_workflow.workflow.load_workflow_file",
+        "causaliq_workflow.workflow.load_workflow_file_with_templates",
         fake_load_workflow_file,
     )
     monkeypatch.setattr(
@@ -114,20 +121,14 @@ def test_expand_matrix_single_variable():
     assert jobs == expected_jobs
 
 
-def test_expand_matrix_exception_handling(monkeypatch):
+def test_expand_matrix_exception_handling():
     """Test matrix expansion fails gracefully with unexpected errors."""
-
-    # Setup mock to raise exception
-    def fake_product(*args, **kwargs):
-        raise RuntimeError("Unexpected error in itertools")
-
-    monkeypatch.setattr("itertools.product", fake_product)
-    matrix = {"algorithm": ["pc", "ges"]}
+    matrix = {"algorithm": ["pc", "ges"], "alpha": 0.05}
     executor = WorkflowExecutor()
     with pytest.raises(WorkflowExecutionError) as exc_info:
         executor.expand_matrix(matrix)
     assert "Matrix expansion failed" in str(exc_info.value)
-    assert "Unexpected error in itertools" in str(exc_info.value)
+    assert "not iterable" in str(exc_info.value)
 
 
 # Test matrix expansion with realistic workflow data
@@ -222,14 +223,14 @@ def test_parse_workflow_valid_templates(monkeypatch):
 
     def fake_load_workflow_file(path):
         assert path == "test.yml"
-        return workflow_data
+        return workflow_data, {"id", "dataset", "algorithm"}
 
     def fake_validate_workflow(data):
         assert data == workflow_data
         return True
 
     monkeypatch.setattr(
-        "causaliq_workflow.workflow.load_workflow_file",
+        "causaliq_workflow.workflow.load_workflow_file_with_templates",
         fake_load_workflow_file,
     )
     monkeypatch.setattr(
@@ -257,14 +258,14 @@ def test_parse_workflow_invalid_templates(monkeypatch):
 
     def fake_load_workflow_file(path):
         assert path == "test.yml"
-        return workflow_data
+        return workflow_data, {"unknown_var", "dataset"}
 
     def fake_validate_workflow(data):
         assert data == workflow_data
         return True
 
     monkeypatch.setattr(
-        "causaliq_workflow.workflow.load_workflow_file",
+        "causaliq_workflow.workflow.load_workflow_file_with_templates",
         fake_load_workflow_file,
     )
     monkeypatch.setattr(
@@ -293,14 +294,14 @@ def test_parse_workflow_no_matrix_valid_templates(monkeypatch):
 
     def fake_load_workflow_file(path):
         assert path == "test.yml"
-        return workflow_data
+        return workflow_data, {"id", "description"}
 
     def fake_validate_workflow(data):
         assert data == workflow_data
         return True
 
     monkeypatch.setattr(
-        "causaliq_workflow.workflow.load_workflow_file",
+        "causaliq_workflow.workflow.load_workflow_file_with_templates",
         fake_load_workflow_file,
     )
     monkeypatch.setattr(
@@ -326,3 +327,175 @@ def test_extract_malformed_templates():
     text2 = "/results/{{valid}}/{invalid}/{{also_valid}}.xml"
     variables2 = executor._extract_template_variables(text2)
     assert variables2 == {"valid", "also_valid"}
+
+
+# Test template resolution scans each template string once across jobs
+def test_resolve_template_variables_memoised():
+    """Test repeated template strings are not rescanned per job."""
+    executor = WorkflowExecutor()
+    inputs = {
+        "data": "/data/{{dataset}}_memoised.csv",
+        "output": ["/results/{{id}}/{{dataset}}_memoised.xml"] * 2,
+    }
+
+    executor._resolve_template_variables(inputs, {"id": "x", "dataset": "a"})
+    info = _scan_template_variables.cache_info()
+    resolved = executor._resolve_template_variables(
+        inputs, {"id": "y", "dataset": "b"}
+    )
+
+    assert resolved == {
+        "data": "/data/b_memoised.csv",
+        "output": ["/results/y/b_memoised.xml"] * 2,
+    }
+    after = _scan_template_variables.cache_info()
+    assert after.misses == info.misses
+    assert after.hits == info.hits + 3
+
+
+# Test template collection on deeply nested workflow objects
+def test_collect_template_variables_deep_nesting():
+    """Test collection does not hit recursion limit on deep nesting."""
+    executor = WorkflowExecutor()
+
+    nested = {"leaf": "/results/{{dataset}}.xml"}
+    for _ in range(5000):
+        nested = {"child": [nested, "{{id}}"]}
+
+    used_variables = set()
+    executor._collect_template_variables(nested, used_variables)
+    assert used_variables == {"dataset", "id"}
+
+
+# Test lazy matrix expansion
+def test_iter_matrix_matches_expand_matrix():
+    """Test iter_matrix yields the same jobs lazily as expand_matrix."""
+    matrix = {
+        "algorithm": ["pc", "ges"],
+        "dataset": ["asia", "cancer"],
+    }
+
+    executor = WorkflowExecutor()
+    jobs = executor.iter_matrix(matrix)
+
+    assert not isinstance(jobs, list)
+    assert list(jobs) == executor.expand_matrix(matrix)
+    assert list(executor.iter_matrix({})) == [{}]
+
+
+# Test lazy matrix job sequence length and indexing
+def test_matrix_jobs_len_and_indexing():
+    """Test MatrixJobs supports len, indexing and slicing lazily."""
+    matrix = {
+        "algorithm": ["pc", "ges", "lingam"],
+        "dataset": ["asia", "cancer"],
+    }
+
+    jobs = MatrixJobs(matrix)
+    expected = WorkflowExecutor().expand_matrix(matrix)
+
+    assert len(jobs) == 6
+    assert list(jobs) == expected
+    assert [jobs[i] for i in range(len(jobs))] == expected
+    assert jobs[-1] == {"algorithm": "lingam", "dataset": "cancer"}
+    assert jobs[1:5:2] == expected[1:5:2]
+
+
+# Test lazy matrix job sequence bounds and empty matrix
+def test_matrix_jobs_index_error_and_empty_matrix():
+    """Test MatrixJobs raises IndexError and handles empty matrix."""
+    jobs = MatrixJobs({"alpha": [0.01, 0.05]})
+
+    with pytest.raises(IndexError):
+        jobs[2]
+    with pytest.raises(IndexError):
+        jobs[-3]
+
+    empty = MatrixJobs({})
+    assert len(empty) == 1
+    assert list(empty) == [{}]
+    assert empty[0] == {}
+    assert len(MatrixJobs({"alpha": []})) == 0
+
+
+# Test generated job builders handle unusual matrix variable names
+def test_matrix_jobs_unusual_variable_names():
+    """Test MatrixJobs keeps quoted and non-string variable names intact."""
+    matrix = {"it's": [1, 2], 'say "hi"': ["a"], 3: [True]}
+
+    jobs = MatrixJobs(matrix)
+
+    assert list(jobs) == [
+        {"it's": 1, 'say "hi"': "a", 3: True},
+        {"it's": 2, 'say "hi"': "a", 3: True},
+    ]
+    assert MatrixJobs({"it's": [1, 2]})[1] == {"it's": 2}
+
+
+# Test executor and matrix job instances use slots rather than a dict
+def test_executor_and_matrix_jobs_use_slots():
+    """Test WorkflowExecutor and MatrixJobs instances have no __dict__."""
+    assert not hasattr(WorkflowExecutor(), "__dict__")
+    assert not hasattr(MatrixJobs({"alpha": [0.05]}), "__dict__")
+
+
+# Test lazy matrix job sequence rejects non-list matrix values
+def test_matrix_jobs_invalid_values():
+    """Test MatrixJobs wraps errors from non-iterable matrix values."""
+    with pytest.raises(WorkflowExecutionError) as exc_info:
+        MatrixJobs({"alpha": 0.05})
+    assert "Matrix expansion failed" in str(exc_info.value)
+
+
+def _square_alpha(job, workflow):
+    """Matrix job runner used by run_matrix tests - must be picklable."""
+    if job["alpha"] < 0:
+        raise ValueError("negative alpha")
+    return (workflow["id"], job["alpha"] ** 2)
+
+
+# Test concurrent execution of matrix jobs
+def test_run_matrix_runs_all_jobs():
+    """Test run_matrix yields each job with its runner result."""
+    workflow = {"id": "matrix-run", "matrix": {"alpha": [1, 2, 3]}}
+
+    executor = WorkflowExecutor()
+    results = list(executor.run_matrix(workflow, _square_alpha, max_workers=2))
+
+    assert sorted((job["alpha"], result) for job, result in results) == [
+        (1, ("matrix-run", 1)),
+        (2, ("matrix-run", 4)),
+        (3, ("matrix-run", 9)),
+    ]
+
+
+# Test concurrent matrix execution draws jobs lazily from the matrix
+def test_run_matrix_bounds_submitted_jobs(monkeypatch):
+    """Test run_matrix only submits a small window of jobs ahead."""
+    workflow = {"id": "matrix-run", "matrix": {"alpha": list(range(100))}}
+    drawn = []
+
+    iter_matrix = WorkflowExecutor.iter_matrix
+
+    def counting_iter_matrix(self, matrix):
+        for job in iter_matrix(self, matrix):
+            drawn.append(job)
+            yield job
+
+    monkeypatch.setattr(WorkflowExecutor, "iter_matrix", counting_iter_matrix)
+    executor = WorkflowExecutor()
+    results = executor.run_matrix(workflow, _square_alpha, max_workers=1)
+    next(results)
+    assert len(drawn) <= 3
+    results.close()
+
+
+# Test concurrent matrix execution surfaces job failures
+def test_run_matrix_job_failure():
+    """Test run_matrix raises WorkflowExecutionError when a job fails."""
+    workflow = {"id": "matrix-run", "matrix": {"alpha": [-1]}}
+
+    executor = WorkflowExecutor()
+    with pytest.raises(WorkflowExecutionError) as exc_info:
+        list(executor.run_matrix(workflow, _square_alpha, max_workers=1))
+    assert "negative alpha" in str(exc_info.value)
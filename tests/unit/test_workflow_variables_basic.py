@@ -97,3 +97,19 @@ def test_validate_required_variables_with_cli_params(executor):
         executor._validate_required_variables(workflow, cli_params)
     except Exception as e:
         pytest.fail(f"Validation should pass when CLI params provided: {e}")
+
+
+def test_template_validation_with_collected_variables(executor):
+    """Test template validation uses variables collected during loading."""
+    workflow = {
+        "id": "test-workflow",
+        "description": "Test workflow",
+        "steps": [{"uses": "dummy_action", "with": {"x": "{{id}}"}}],
+    }
+
+    # Supplied variables are checked instead of scanning the workflow
+    executor._validate_template_variables(workflow, {"id"})
+
+    with pytest.raises(Exception) as exc_info:
+        executor._validate_template_variables(workflow, {"unknown_var"})
+    assert "unknown_var" in str(exc_info.value)